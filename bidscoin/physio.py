@@ -8,11 +8,13 @@ https://github.com/CMRR-C2P/MB
 """
 
 import pandas as pd
+import io
 import json
-import struct
 import logging
 import numpy as np
 import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Union
 from pydicom import dcmread, tag
 from pathlib import Path
@@ -21,11 +23,33 @@ from pathlib import Path
 LOGVERSION = 'EJA_1'                # This is the file format this function expects; must match log file version
 FREQ       = 1 / 2.5E-3             # Sampling frequency (the unit of SIEMENS ticks is 2.5 ms)
 
+# Known header parameters and their parsers. NB: NumSlices/NumVolumes/FirstTime/LastTime/NumEchoes are only
+# valid in ACQUISITION_INFO logs, whereas SampleTime is only valid in the ECG/RESP/PULS/EXT logs
+HEADERPARSERS = {'UUID':        str,
+                 'LogVersion':  str,
+                 'LogDataType': str,
+                 'SampleTime':  int,
+                 'NumSlices':   int,
+                 'NumVolumes':  int,
+                 'FirstTime':   int,
+                 'LastTime':    int,
+                 'NumEchoes':   int}
+INFOHEADERS   = {'NumSlices', 'NumVolumes', 'FirstTime', 'LastTime', 'NumEchoes'}
+
+# Channel-ID to trace-column indices of the multi-channel log types (the other types have a single unnamed column)
+CHANNELIDX    = {'ECG': {'ECG1': 0, 'ECG2': 1, 'ECG3': 2, 'ECG4': 3},
+                 'EXT': {'EXT': 0, 'EXT1': 0, 'EXT2': 1}}
+
+# Specialized traces lay-out per logdatatype: (channel indices, nr of trace columns, dtype). The samples range
+# 0..4095 (int16) and EXT is a 0/1 trigger (uint8); single-channel types (RESP/PULS) fall back to ({}, 1, int16)
+TRACESPECS    = {logdatatype: (channelidx, max(channelidx.values()) + 1, np.uint8 if logdatatype=='EXT' else np.int16)
+                 for logdatatype, channelidx in CHANNELIDX.items()}
+
 # Set-up logging
 LOGGER = logging.getLogger('physio')
 
 
-def readparsefile(fn: Union[bytes,Path], logdatatype: str, firsttime: int=0, expectedsamples: int=0) -> tuple:
+def readparsefile(fn: Union[bytes,memoryview,Path], logdatatype: str, firsttime: int=0, expectedsamples: int=0) -> tuple:
     """
     Read and parse physiologal traces from the DICOM data or from individual logfiles
 
@@ -33,132 +57,128 @@ def readparsefile(fn: Union[bytes,Path], logdatatype: str, firsttime: int=0, exp
     :param logdatatype:     Datatype that is extracted, e.g. 'ECG', 'RESP', 'PULS' or 'EXT'. Additional meta data is extracted if 'ACQUISITION_INFO'
     :param firsttime:       Value from readparsefile('ACQUISITION_INFO', ..) that has to be passed for parsing other logdatatypes
     :param expectedsamples: Number of samples of the parsed traces
-    :return:                traces, UUID[, nrslices, nrvolumes, firsttime, lasttime, nrechoes] ([..] if logdatatype=='ACQUISITION_INFO')
+    :return:                traces (int16, or uint8 for EXT), UUID[, nrslices, nrvolumes, firsttime, lasttime, nrechoes] ([..] if logdatatype=='ACQUISITION_INFO')
     """
 
     # Echoes parameter was not added until R015a, so prefill a default value for compatibility with older data
-    nrechoes = 1
-    traces   = None
+    nrechoes  = 1
+    traces    = None
+    datalines = []
 
-    # Parse the input data into a list of lines
-    if isinstance(fn, bytes):                           # If fn is a bytestring, we read it directly from DICOM
-        lines = fn.decode('UTF-8').splitlines()
+    # Parse the input data into a list of byte lines (decoding is deferred: only the few header lines need it)
+    if isinstance(fn, (bytes, memoryview)):             # If fn is a (view on a) bytestring, we read it directly from DICOM
+        lines = bytes(fn).splitlines()
     elif isinstance(fn, Path):                          # Otherwise, fn must be a filename
         LOGGER.info(f"Reading physio log-file: {fn}")
-        with fn.open('r') as fid:
-            lines = fid.read().splitlines()
+        lines = fn.read_bytes().splitlines()
     else:
         LOGGER.error(f"Wrong input {fn}: {type(fn)}"); raise FileNotFoundError(fn)
 
-    # Extract the meta data and physiological traces
+    # Split the lines into header and data lines in a single pass (the headers always precede the data in the log)
     LOGGER.info(f"Parsing {logdatatype} data...")
-    for line in [line for line in lines if line]:
-
-        # Strip any leading and trailing whitespace and comments
-        line = line.split('#')[0].strip()
-
-        if '=' in line:
-
-            # This is an assigned value; parse it
-            varname, value = [item.strip() for item in line.split('=')]
-
-            if varname == 'UUID':
-                UUID = value
-            if varname == 'LogVersion':
-                if value != LOGVERSION:
-                    LOGGER.error(f"File format [{value}] not supported by this function (expected [{LOGVERSION}])"); raise NotImplementedError(f"Version{value}")
-            if varname == 'LogDataType':
-                if value != logdatatype:
-                    LOGGER.error(f"Expected [{logdatatype}] data, found [{value}]? Check filenames?"); raise ValueError(value)
-            if varname == 'SampleTime':
-                if logdatatype == 'ACQUISITION_INFO':
-                    LOGGER.error(f"Invalid [{varname}] parameter found"); raise ValueError(varname)
-                sampletime = int(value)
-            if varname == 'NumSlices':
-                if logdatatype != 'ACQUISITION_INFO':
-                    LOGGER.error(f"Invalid [{varname}] parameter found"); raise ValueError(varname)
-                nrslices = int(value)
-            if varname == 'NumVolumes':
-                if logdatatype != 'ACQUISITION_INFO':
-                    LOGGER.error(f"Invalid [{varname}] parameter found"); raise ValueError(varname)
-                nrvolumes = int(value)
-            if varname == 'FirstTime':
-                if logdatatype != 'ACQUISITION_INFO':
-                    LOGGER.error(f"Invalid [{varname}] parameter found"); raise ValueError(varname)
-                firsttime = int(value)
-            if varname == 'LastTime':
-                if logdatatype != 'ACQUISITION_INFO':
-                    LOGGER.error(f"Invalid [{varname}] parameter found"); raise ValueError(varname)
-                lasttime = int(value)
-            if varname == 'NumEchoes':
-                if logdatatype != 'ACQUISITION_INFO':
-                    LOGGER.error(f"Invalid [{varname}] parameter found"); raise ValueError(varname)
-                nrechoes = int(value)
-
+    headerlines = []
+    for line in lines:
+
+        # Strip any trailing comments and leading/trailing whitespace
+        line = line.partition(b'#')[0].strip()
+        if not line:
+            continue
+
+        if b'=' in line:
+            headerlines.append(line)
+        elif line[:1].isdigit():
+            datalines.append(line)      # If the first character isn't numeric, it is probably the data header
+
+    # Parse the header lines with a single dict-lookup per line and check their validity for this logdatatype once
+    headers        = {}
+    invalidheaders = {'SampleTime'} if logdatatype == 'ACQUISITION_INFO' else INFOHEADERS
+    for line in headerlines:
+        varname, value = [item.strip() for item in line.decode('UTF-8').split('=')]
+        parser = HEADERPARSERS.get(varname)
+        if not parser:
+            continue
+        if varname in invalidheaders:
+            LOGGER.error(f"Invalid [{varname}] parameter found"); raise ValueError(varname)
+        headers[varname] = parser(value)
+    if headers.get('LogVersion', LOGVERSION) != LOGVERSION:
+        LOGGER.error(f"File format [{headers['LogVersion']}] not supported by this function (expected [{LOGVERSION}])"); raise NotImplementedError(f"Version{headers['LogVersion']}")
+    if headers.get('LogDataType', logdatatype) != logdatatype:
+        LOGGER.error(f"Expected [{logdatatype}] data, found [{headers['LogDataType']}]? Check filenames?"); raise ValueError(headers['LogDataType'])
+    UUID       = headers.get('UUID')
+    sampletime = headers.get('SampleTime')
+    nrslices   = headers.get('NumSlices')
+    nrvolumes  = headers.get('NumVolumes')
+    firsttime  = headers.get('FirstTime', firsttime)
+    lasttime   = headers.get('LastTime')
+    nrechoes   = headers.get('NumEchoes', nrechoes)
+
+    # Store the acquisition info in the output array
+    if logdatatype == 'ACQUISITION_INFO' and datalines:
+
+        # The header pass has completed, so the ACQINFO parameters can be validated once (instead of per data line)
+        if (nrvolumes is None or nrvolumes < 1 or
+            nrslices  is None or nrslices  < 1 or nrechoes < 1):
+            LOGGER.error('Failed reading ACQINFO header'); raise RuntimeError(fn)
+        if nrvolumes == 1:
+            # This is probably R016a or earlier diffusion data, where NumVolumes is 1 (incorrect)
+            nrvolumes = (len(lines) - 11) / (nrslices * nrechoes)
+            LOGGER.warning(f"Found NumVolumes = 1; correcting to {nrvolumes} for R016a and earlier diffusion data")
+
+        # Parse the integer data columns in one pass (instead of int() calls per line); currently the data
+        # is 3-5 columns, pad it with 0 if needed to always have 5 columns
+        data = np.atleast_2d(np.genfromtxt(datalines, dtype=np.int64))
+        if data.shape[1] < 5:
+            data = np.hstack((data, np.zeros((len(data), 5 - data.shape[1]), dtype=np.int64)))
+        curvol, curslc, curstart, curfinish, cureco = data.T
+
+        # Check for duplicate timing data before scattering the start/finish times into the output array
+        flatindex      = (curvol * nrslices + curslc) * nrechoes + cureco
+        uniqueindex, counts = np.unique(flatindex, return_counts=True)
+        if counts.max() > 1:
+            dupindex       = int(uniqueindex[counts > 1][0])
+            dupvol, dupeco = divmod(dupindex, nrechoes)
+            dupvol, dupslc = divmod(dupvol, nrslices)
+            LOGGER.error(f"Received duplicate timing data for vol{dupvol} slc{dupslc} eco{dupeco}"); raise ValueError(fn)
+
+        # Keep the start/finish times adjacent in memory (last axis), which halves the cache-line fetches downstream
+        traces = np.zeros((int(nrvolumes), nrslices, nrechoes, 2), dtype=np.int32)      # int32 fits ~60 days of 2.5 ms ticks
+        traces[curvol, curslc, cureco, 0] = curstart
+        traces[curvol, curslc, cureco, 1] = curfinish
+
+    # Parse all physiological data lines in a single vectorized pass (much faster than a Python-level loop over the samples)
+    elif logdatatype != 'ACQUISITION_INFO':
+
+        # The channel count and dtype are fixed by the logdatatype, so the output array can be preallocated up front
+        channelidx, nrchannels, dtype = TRACESPECS.get(logdatatype, ({}, 1, np.int16))
+        traces = np.zeros((expectedsamples, nrchannels), dtype=dtype)
+
+    if datalines and logdatatype != 'ACQUISITION_INFO':
+
+        # Split the data lines into integer timestamp/value columns and a categorical channel column (columns 4-5 are
+        # not used). The pandas C-tokenizer is considerably faster than np.genfromtxt on large (multi-minute) logs
+        data     = pd.read_csv(io.BytesIO(b'\n'.join(datalines)), sep=r'\s+', header=None, engine='c',
+                               names=['time','channel','value'], usecols=[0,1,2],
+                               dtype={'time':np.int64, 'channel':'category', 'value':np.int64})
+        curstart = data['time'].to_numpy() - firsttime
+        curvalue = data['value'].to_numpy()
+        if channelidx:
+            channels = data['channel'].cat.categories
+            for curchannel in channels:
+                if curchannel not in channelidx:
+                    LOGGER.error(f"Invalid {logdatatype} channel ID [{curchannel}]"); raise ValueError(curchannel)
+            chaidx = np.array([channelidx[curchannel] for curchannel in channels])[data['channel'].cat.codes.to_numpy()]
         else:
-
-            # This must be data; currently it is 3-5 columns, pad it with '0' if needed to always have 5 columns
-            dataitems = line.split()
-            dataitems = [dataitems[n] if n < len(dataitems) else '0' for n in range(5)]
-
-            # If the first column isn't numeric, it is probably the header
-            if not dataitems[0].isdigit():
-                continue
-
-            # Store data in output array based on the file type
-            if logdatatype == 'ACQUISITION_INFO':
-
-                if ('nrvolumes' not in locals() or nrvolumes < 1 or
-                    'nrslices'  not in locals() or nrslices  < 1 or
-                    'nrechoes'  not in locals() or nrechoes  < 1):
-                    LOGGER.error('Failed reading ACQINFO header'); raise RuntimeError(fn)
-                if nrvolumes == 1:
-                    # This is probably R016a or earlier diffusion data, where NumVolumes is 1 (incorrect)
-                    nrvolumes = (len(lines) - 11) / (nrslices * nrechoes)
-                    LOGGER.warning(f"Found NumVolumes = 1; correcting to {nrvolumes} for R016a and earlier diffusion data")
-                if traces is None:
-                    traces = np.zeros((2, nrvolumes, nrslices, nrechoes), dtype=int)
-                curvol    = int(dataitems[0])
-                curslc    = int(dataitems[1])
-                curstart  = int(dataitems[2])
-                curfinish = int(dataitems[3])
-                if len(dataitems[4]):
-                    cureco = int(dataitems[4])
-                    if traces[:, curvol, curslc, cureco].any():
-                        LOGGER.error(f"Received duplicate timing data for vol{curvol} slc{curslc} eco{cureco}"); raise ValueError(fn)
-                else:
-                    cureco = 0
-                    if traces[:, curvol, curslc, cureco]:
-                        LOGGER.warning(f"Received duplicate timing data for vol{curvol} slc{curslc} (ignore for pre-R015a multi-echo data)")
-                traces[:, curvol, curslc, cureco] = [curstart, curfinish]
-
-            else:
-
-                curstart   = int(dataitems[0]) - firsttime
-                curchannel = dataitems[1]
-                curvalue   = int(dataitems[2])
-
-                if logdatatype == 'ECG':
-                    if traces is None:
-                        traces = np.zeros((expectedsamples, 4), dtype=int)
-                    if curchannel not in ['ECG1', 'ECG2', 'ECG3', 'ECG4']:
-                        LOGGER.error(f"Invalid ECG channel ID [{curchannel}]"); raise ValueError(curchannel)
-                    chaidx = ['ECG1', 'ECG2', 'ECG3', 'ECG4'].index(curchannel)
-                elif logdatatype == 'EXT':
-                    if traces is None:
-                        traces = np.zeros((expectedsamples, 2), dtype=int)
-                    if curchannel not in ['EXT', 'EXT1', 'EXT2']:
-                        LOGGER.error(f"Invalid EXT channel ID [{curchannel}]"); raise ValueError(curchannel)
-                    if curchannel == 'EXT':
-                        chaidx = 0
-                    else:
-                        chaidx = ['EXT1', 'EXT2'].index(curchannel)
-                else:
-                    if traces is None:
-                        traces = np.zeros((expectedsamples, 1), dtype=int)
-                    chaidx = 0
-
-                traces[curstart:curstart+int(sampletime), chaidx] = curvalue
+            chaidx = np.zeros(len(curstart), dtype=int)
+
+        # Scatter every value over its sample window, i.e. traces[curstart:curstart+sampletime, chaidx] = curvalue
+        sampletime = int(sampletime)
+        rows = (curstart[:,None] + np.arange(sampletime)[None,:]).ravel()
+        cols = np.repeat(chaidx,   sampletime)
+        vals = np.repeat(curvalue, sampletime)
+        if curstart.min() < 0 or curstart.max() + sampletime > expectedsamples:
+            keep = (rows >= 0) & (rows < expectedsamples)   # Clip the windows to the traces, like the slice assignment did
+            rows, cols, vals = rows[keep], cols[keep], vals[keep]
+        traces[rows, cols] = vals
 
     if logdatatype == 'ACQUISITION_INFO':
         traces = traces - firsttime
@@ -167,6 +187,54 @@ def readparsefile(fn: Union[bytes,Path], logdatatype: str, firsttime: int=0, exp
         return traces, UUID
 
 
+@lru_cache(maxsize=8)
+def splitdicomphysio(fn: str, mtime: int, size: int) -> dict:
+    """
+    Extract the physiological logfiles that are embedded in a SIEMENS PHYSIO DICOM file. The results are cached, so
+    that repeated calls for the same (unmodified) DICOM file (e.g. when converting multiple runs) skip the DICOM parsing
+
+    :param fn:      The fullpath of the DICOM file
+    :param mtime:   The modification time of the DICOM file (in ns, only used as part of the cache key)
+    :param size:    The size of the DICOM file (only used as part of the cache key)
+    :return:        The raw {'INFO'/'ECG'/'RESP'/'PULS'/'EXT': bytes} data of the embedded logfiles
+    """
+
+    LOGGER.info(f"Reading physio DICOM file: {fn}")
+    dicomdata     = dcmread(fn, force=True)             # The DICM tag may be missing for anonymized DICOM files
+    manufacturer  = dicomdata.get('Manufacturer')
+    physioelement = dicomdata.get(tag.Tag('7fe1', '1010'))
+    if manufacturer and manufacturer != 'SIEMENS':
+        LOGGER.warning(f"Unsupported manufacturer: '{manufacturer}', this function is designed for SIEMENS advanced physiological logging data")
+    if not (dicomdata.get('ImageType')==['ORIGINAL','PRIMARY','RAWDATA','PHYSIO'] and physioelement.private_creator=='SIEMENS CSA NON-IMAGE'):
+        LOGGER.error(f"{fn} is not a valid DICOM format file"); raise RuntimeError(f"Invalid DICOM: {fn}")
+
+    physiodata = physioelement.value
+    rows       = int(dicomdata.AcquisitionNumber)
+    columns    = len(physiodata)/rows
+    nrfiles    = columns/1024
+    if columns%1 or nrfiles%1:
+        LOGGER.error(f"Invalid image size: [rows x columns] = [{rows} x {columns}]"); raise ValueError
+    # Encoded DICOM format: columns = 1024*nrfiles
+    #                       first row: uint32 datalen, uint32 filenamelen, char[filenamelen] filename
+    #                       remaining rows: char[datalen] data
+    physiodata = memoryview(physiodata)                 # Zero-copy views instead of bytes-slice copies of the (MB-sized) chunks
+    # Scan all (datalen, filenamelen) uint32 header pairs at once with a zero-copy strided view
+    filelengths = np.lib.stride_tricks.as_strided(np.frombuffer(physiodata, dtype='<u4'),
+                                                  shape=(int(nrfiles), 2), strides=(rows*1024, 4))
+    logfiles = {}
+    for idx in range(int(nrfiles)):
+        filestart = idx*rows*1024
+        datalen, filenamelen = filelengths[idx]
+        filename  = str(physiodata[filestart+8:filestart+8+filenamelen], 'UTF-8')
+        logdata   = physiodata[filestart+1024:filestart+1024+datalen]
+        LOGGER.info(f"Decoded: {filename}")
+        for logdatatype in ('Info', 'ECG', 'RESP', 'PULS', 'EXT'):
+            if filename.endswith(f"_{logdatatype}.log"):
+                logfiles[logdatatype.upper()] = logdata
+
+    return logfiles
+
+
 def readphysio(fn: Union[str,Path]) -> dict:
     """
     Read and plots active (i.e. non-zero) signals from SIEMENS advanced physiological log / DICOM files (>=R013, >=VD13A)
@@ -178,7 +246,7 @@ def readphysio(fn: Union[str,Path]) -> dict:
 
     physio['UUID']:     Universally unique identifier string for this measurement
     physio['Freq']:     Sampling frequency in Hz (= 1/clock-tick; The unit of time is clock-ticks, which normally is 2.5 ms)
-    physio['SliceMap']: [2 x Volumes x Slices]     [1:2,:,:] = start & finish time stamp of each volume/slice
+    physio['SliceMap']: [Volumes x Slices x Echoes x 2]    [:,:,:,0:2] = start & finish time stamp of each volume/slice
     physio['ACQ']:      [length = nr of samples]   True if acquisition is active at this time; False if not
     physio['ECG1']:     [length = nr of samples]   ECG signal on this channel
     physio['ECG2']:     [length = nr of samples]   [..]
@@ -200,45 +268,17 @@ def readphysio(fn: Union[str,Path]) -> dict:
 
     # First, check if the input points to a valid DICOM file. If so, extract the physiological data
     if fn.is_file():
-        LOGGER.info(f"Reading physio DICOM file: {fn}")
-        dicomdata    = dcmread(fn, force=True)          # The DICM tag may be missing for anonymized DICOM files
-        manufacturer = dicomdata.get('Manufacturer')
-        physiotag    = tag.Tag('7fe1', '1010')
-        if manufacturer and manufacturer != 'SIEMENS':
-            LOGGER.warning(f"Unsupported manufacturer: '{manufacturer}', this function is designed for SIEMENS advanced physiological logging data")
-        if dicomdata.get('ImageType')==['ORIGINAL','PRIMARY','RAWDATA','PHYSIO'] and dicomdata.get(physiotag).private_creator=='SIEMENS CSA NON-IMAGE':
-            physiodata = dicomdata[physiotag].value
-            rows       = int(dicomdata.AcquisitionNumber)
-            columns    = len(physiodata)/rows
-            nrfiles    = columns/1024
-            if columns%1 or nrfiles%1:
-                LOGGER.error(f"Invalid image size: [rows x columns] = [{rows} x {columns}]"); raise ValueError
-            # Encoded DICOM format: columns = 1024*nrfiles
-            #                       first row: uint32 datalen, uint32 filenamelen, char[filenamelen] filename
-            #                       remaining rows: char[datalen] data
-            for idx in range(int(nrfiles)):
-                filedata    = physiodata[idx*rows*1024:(idx+1)*rows*1024]
-                datalen     = struct.unpack('<L', filedata[0:4])[0]
-                filenamelen = struct.unpack('<L', filedata[4:8])[0]
-                filename    = filedata[8:8+filenamelen].decode('UTF-8')
-                logdata     = filedata[1024:1024+datalen]
-                LOGGER.info(f"Decoded: {filename}")
-                if filename.endswith('_Info.log'):
-                    fnINFO    = logdata
-                elif filename.endswith('_ECG.log'):
-                    fnECG     = logdata
-                    foundECG  = True
-                elif filename.endswith('_RESP.log'):
-                    fnRESP    = logdata
-                    foundRESP = True
-                elif filename.endswith('_PULS.log'):
-                    fnPULS    = logdata
-                    foundPULS = True
-                elif filename.endswith('_EXT.log'):
-                    fnEXT     = logdata
-                    foundEXT  = True
-        else:
-            LOGGER.error(f"{fn} is not a valid DICOM format file"); raise RuntimeError(f"Invalid DICOM: {fn}")
+        filestat  = fn.stat()
+        logfiles  = splitdicomphysio(str(fn), filestat.st_mtime_ns, filestat.st_size)
+        fnINFO    = logfiles.get('INFO')
+        fnECG     = logfiles.get('ECG')
+        fnRESP    = logfiles.get('RESP')
+        fnPULS    = logfiles.get('PULS')
+        fnEXT     = logfiles.get('EXT')
+        foundECG  = 'ECG'  in logfiles
+        foundRESP = 'RESP' in logfiles
+        foundPULS = 'PULS' in logfiles
+        foundEXT  = 'EXT'  in logfiles
 
     # If we don't have an encoded DICOM, check what text log files we have
     else:
@@ -254,6 +294,13 @@ def readphysio(fn: Union[str,Path]) -> dict:
         foundPULS = fnPULS.is_file()
         foundEXT  = fnEXT.is_file()
 
+        # Submit all 4+1 file reads in one batch (the reads are independent, only the parsing below needs the Info data first)
+        LOGGER.info(f"Reading physio log-files: {fn}_*.log")
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            fnINFO, fnECG, fnRESP, fnPULS, fnEXT = executor.map(
+                lambda logfile: logfile.read_bytes() if logfile.is_file() else None,
+                (fnINFO, fnECG, fnRESP, fnPULS, fnEXT))
+
     if not foundECG and not foundRESP and not foundPULS and not foundEXT:
         LOGGER.error('No data files (ECG/RESP/PULS/EXT) found'); raise FileNotFoundError(fn)
 
@@ -264,25 +311,21 @@ def readphysio(fn: Union[str,Path]) -> dict:
     actualsamples   = lasttime - firsttime + 1
     expectedsamples = actualsamples + 8         # Some padding at the end for worst case EXT sample at last timestamp
 
-    if foundECG:
-        ECG, UUID2 = readparsefile(fnECG, 'ECG', firsttime, expectedsamples)
-        if UUID1 != UUID2:
-            LOGGER.error('UUID mismatch between Info and ECG files'); raise ValueError(UUID2)
-
-    if foundRESP:
-        RESP, UUID3 = readparsefile(fnRESP, 'RESP', firsttime, expectedsamples)
-        if UUID1 != UUID3:
-            LOGGER.error('UUID mismatch between Info and RESP files'); raise ValueError(UUID3)
-
-    if foundPULS:
-        PULS, UUID4 = readparsefile(fnPULS, 'PULS', firsttime, expectedsamples)
-        if UUID1 != UUID4:
-            LOGGER.error('UUID mismatch between Info and PULS files'); raise ValueError(UUID4)
-
-    if foundEXT:
-        EXT, UUID5 = readparsefile(fnEXT, 'EXT', firsttime, expectedsamples)
-        if UUID1 != UUID5:
-            LOGGER.error('UUID mismatch between Info and EXT files'); raise ValueError(UUID5)
+    # Parse the (fully independent) ECG/RESP/PULS/EXT files concurrently, i.e. overlapping their file I/O and NumPy work
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {}
+        if foundECG:  futures['ECG']  = executor.submit(readparsefile, fnECG,  'ECG',  firsttime, expectedsamples)
+        if foundRESP: futures['RESP'] = executor.submit(readparsefile, fnRESP, 'RESP', firsttime, expectedsamples)
+        if foundPULS: futures['PULS'] = executor.submit(readparsefile, fnPULS, 'PULS', firsttime, expectedsamples)
+        if foundEXT:  futures['EXT']  = executor.submit(readparsefile, fnEXT,  'EXT',  firsttime, expectedsamples)
+        traces = {logdatatype: future.result() for logdatatype, future in futures.items()}
+    for logdatatype, (_, UUIDN) in traces.items():
+        if UUID1 != UUIDN:
+            LOGGER.error(f"UUID mismatch between Info and {logdatatype} files"); raise ValueError(UUIDN)
+    if foundECG:  ECG,  _ = traces['ECG']
+    if foundRESP: RESP, _ = traces['RESP']
+    if foundPULS: PULS, _ = traces['PULS']
+    if foundEXT:  EXT,  _ = traces['EXT']
 
     LOGGER.info(f"Slices in scan:      {nrslices}")
     LOGGER.info(f"Volumes in scan:     {nrvolumes}")
@@ -292,30 +335,37 @@ def readphysio(fn: Union[str,Path]) -> dict:
     LOGGER.info(f"Total scan duration: {actualsamples} ticks = {actualsamples / FREQ:.4f} s")
 
     LOGGER.info('Formatting ACQ data...')
-    ACQ = np.full((expectedsamples, 1), False)
-    for v in range(nrvolumes):
-        for s in range(nrslices):
-            for e in range(nrechoes):
-                ACQ[slicemap[0,v,s,e]:slicemap[1,v,s,e]+1, 0] = True
+    # Mark all [start, finish] slice-acquisition windows as active using a prefix-sum over the window edges
+    # (this avoids a Python-level triple loop over all nrvolumes x nrslices x nrechoes windows). Unwritten
+    # windows of partial/aborted acquisitions are left at 0 - firsttime in the slicemap; mask those out
+    start  = slicemap[...,0].ravel()
+    finish = slicemap[...,1].ravel()
+    valid  = (start >= 0) & (finish >= start)
+    edges  = np.zeros(expectedsamples + 1, dtype=int)
+    np.add.at(edges, start[valid],      1)
+    np.add.at(edges, finish[valid] + 1, -1)
+    ACQ = np.cumsum(edges[:-1]) > 0
 
     # Only return active (nonzero) physio traces
     physio             = dict()
     physio['UUID']     = UUID1
     physio['Freq']     = FREQ
     physio['SliceMap'] = slicemap
-    physio['ACQ']      = ACQ[:,0]
-    if foundECG and ECG.any():
-        if sum(ECG[:,0]): physio['ECG1'] = ECG[:,0]
-        if sum(ECG[:,1]): physio['ECG2'] = ECG[:,1]
-        if sum(ECG[:,2]): physio['ECG3'] = ECG[:,2]
-        if sum(ECG[:,3]): physio['ECG4'] = ECG[:,3]
+    physio['ACQ']      = ACQ
+    if foundECG:
+        ecgactive = ECG.any(axis=0)
+        if ecgactive[0]:  physio['ECG1'] = ECG[:,0]
+        if ecgactive[1]:  physio['ECG2'] = ECG[:,1]
+        if ecgactive[2]:  physio['ECG3'] = ECG[:,2]
+        if ecgactive[3]:  physio['ECG4'] = ECG[:,3]
     if foundRESP and RESP.any():
-        if sum(RESP):     physio['RESP'] = RESP[:,0]
+        physio['RESP'] = RESP[:,0]
     if foundPULS and PULS.any():
-        if sum(PULS):     physio['PULS'] = PULS[:,0]
-    if foundEXT and EXT.any():
-        if sum(EXT[:,0]): physio['EXT1'] = EXT[:,0]
-        if sum(EXT[:,1]): physio['EXT2'] = EXT[:,1]
+        physio['PULS'] = PULS[:,0]
+    if foundEXT:
+        extactive = EXT.any(axis=0)
+        if extactive[0]:  physio['EXT1'] = EXT[:,0]
+        if extactive[1]:  physio['EXT2'] = EXT[:,1]
 
     return physio
 
@@ -372,10 +422,10 @@ def plotphysio(physio:dict, showsamples: int=1000):
         if logdatatype not in physio: return
         nonlocal miny, maxy
         trace    = physio[logdatatype][starttick:endtick]
-        mintrace = int(min(trace))      # type(ACQ)==bool
-        maxtrace = int(max(trace))
+        mintrace = int(trace.min())     # int() because type(ACQ)==bool
+        maxtrace = int(trace.max())
         if scale and (miny != mintrace or maxy != maxtrace):
-            trace = (trace - mintrace) * (maxy - miny)/(maxtrace - mintrace) + miny
+            trace = (trace.astype(int) - mintrace) * (maxy - miny)/(maxtrace - mintrace) + miny      # astype(int) to avoid overflowing the small trace dtypes
         else:
             miny = min(miny, mintrace)  # Update the (non-local) minimum
             maxy = max(maxy, maxtrace)  # Update the (non-local) maximum
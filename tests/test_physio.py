@@ -0,0 +1,47 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from bidscoin.physio import readphysio
+
+
+class TestPhysio(unittest.TestCase):
+
+    def test_readphysio_aborted_scan(self):
+        """An Info file declaring more volumes than its data rows cover (aborted scan) must still parse"""
+        uuid      = 'abcd1234-0000-1111-2222-333344445555'
+        firsttime = 30000000
+        infolines = [f"UUID = {uuid}",
+                     'LogVersion = EJA_1',
+                     'LogDataType = ACQUISITION_INFO',
+                     'NumSlices = 2',
+                     'NumVolumes = 4',
+                     'NumEchoes = 1',
+                     f"FirstTime = {firsttime}",
+                     f"LastTime = {firsttime + 1000}",
+                     'VOLUME   SLICE   ACQ_START_TICS  ACQ_FINISH_TICS  ECHO']
+        for vol in range(2):            # The scan was aborted after 2 of the 4 declared volumes
+            for slc in range(2):
+                start = firsttime + (vol*2 + slc) * 10
+                infolines.append(f"{vol} {slc} {start} {start + 9} 0")
+        pulslines = [f"UUID = {uuid}",
+                     'LogVersion = EJA_1',
+                     'LogDataType = PULS',
+                     'SampleTime = 2',
+                     'ACQ_TIME_TICS  CHANNEL  VALUE',
+                     f"{firsttime} PULS 42"]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            basename = Path(tmpdir)/'Physio_test'
+            basename.with_name(basename.name + '_Info.log').write_text('\n'.join(infolines) + '\n')
+            basename.with_name(basename.name + '_PULS.log').write_text('\n'.join(pulslines) + '\n')
+            physio = readphysio(basename)
+
+        acq = physio['ACQ']
+        self.assertEqual(len(acq), 1009)                # LastTime - FirstTime + 1 + 8 padding
+        self.assertTrue(acq[0:40].all())                # The 4 acquired slice windows
+        self.assertFalse(acq[40:].any())                # The unwritten windows of the aborted volumes
+
+
+if __name__ == '__main__':
+    unittest.main()